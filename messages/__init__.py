@@ -2,21 +2,41 @@
 messages - A package designed to make sending various types of messages easy.
 """
 
+import importlib
 import logging
 
-from .api import send
 
-from .email_ import Email
-from .slack import SlackWebhook
-from .slack import SlackPost
-from .telegram import TelegramBot
-from .text import Twilio
-from .whatsapp import WhatsApp
-
-from ._exceptions import MessageSendError
+__version__ = "0.6.0"
 
 
-__version__ = "0.6.0"
+# Lazy attribute loading (PEP 562).  Each backend pulls in its own
+# dependency stack (requests, Twilio validation, the async event loop),
+# so they are imported on first reference instead of at package import,
+# keeping start-up cost proportional to what is actually used.
+_LAZY_ATTRS = {
+    "send": "api",
+    "MESSAGES": "api",
+    "Email": "email_",
+    "SlackWebhook": "slack",
+    "SlackPost": "slack",
+    "TelegramBot": "telegram",
+    "Twilio": "text",
+    "WhatsApp": "whatsapp",
+    "MessageSendError": "_exceptions",
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_ATTRS:
+        module = importlib.import_module("." + _LAZY_ATTRS[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
 
 
 # Setup logger
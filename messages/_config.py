@@ -178,7 +178,7 @@ def create_config_profile(msg_type):
     """
     msg_type = msg_type.lower()
 
-    if msg_type not in CONFIG.keys():
+    if msg_type not in CONFIG:
         raise UnsupportedMessageTypeError(msg_type)
 
     display_required_items(msg_type)
@@ -1,23 +1,54 @@
 """
 Module that will handle asynchronous message sending, so each message will
 be non-blocking.
+
+Async sends run on a bounded thread pool rather than an event loop or
+cooperative (monkey-patched) sockets: nothing global is altered, the
+synchronous send() path is untouched, and the pooled HTTP sessions in the
+backend modules are shared safely across worker threads.
 """
 
+import threading
 from concurrent.futures.thread import ThreadPoolExecutor as PoolExecutor
 
 from ._exceptions import UnsupportedMessageTypeError
 
 
-def _send_coroutine():
+def _hashable(value):
+    """Convert list- or dict-valued message fields (to, cc, auth pairs,
+       params) to tuples so they can sit in the dedup key."""
+    if isinstance(value, list):
+        return tuple(value)
+    if isinstance(value, dict):
+        return tuple(sorted(value.items()))
+    return value
+
+
+def _message_key(msg):
     """
-    Creates a running coroutine to receive message instances and send
-    them in a futures executor.
+    Stable content key used to detect duplicate sends.  Includes the
+    credential, sender and destination fields alongside the content, so
+    identical bodies aimed at different recipients, accounts or webhook
+    URLs are never collapsed; unstable per-send state stays out.
     """
-    with PoolExecutor() as executor:
-        while True:
-            msg = yield
-            future = executor.submit(msg.send)
-            future.add_done_callback(_exception_handler)
+    attachments = getattr(msg, "attachments", None) or []
+    if isinstance(attachments, str):
+        attachments = [attachments]
+    return (
+        type(msg).__name__,
+        _hashable(getattr(msg, "_auth", None)),
+        getattr(msg, "url", None),
+        getattr(msg, "from_", None),
+        getattr(msg, "chat_id", None),
+        getattr(msg, "channel", None),
+        _hashable(getattr(msg, "to", None)),
+        _hashable(getattr(msg, "cc", None)),
+        _hashable(getattr(msg, "bcc", None)),
+        getattr(msg, "subject", None),
+        getattr(msg, "body", ""),
+        tuple(attachments),
+        _hashable(getattr(msg, "params", None)),
+    )
 
 
 def _exception_handler(future):
@@ -28,18 +59,44 @@ def _exception_handler(future):
 
 
 class MessageLoop:
-    """Asynchronous message sending loop."""
+    """Asynchronous message sending loop backed by a bounded worker pool."""
 
-    def __init__(self):
-        self._coro = _send_coroutine()
-        next(self._coro)
+    def __init__(self, max_workers=32):
+        self._max_workers = max_workers
+        self._executor = None
+        self._in_flight = set()
+
+    def _get_executor(self):
+        """Create the worker pool on first use, so merely importing the
+           package never sets up async machinery."""
+        if self._executor is None:
+            self._executor = PoolExecutor(max_workers=self._max_workers)
+        return self._executor
 
     def add_message(self, msg):
-        """Add a message to the futures executor."""
+        """Submit a message to the worker pool and return immediately.
+           An exact duplicate of a message still in flight is dropped, so
+           retry-loop mistakes cannot double-send."""
         try:
-            self._coro.send(msg)
+            send = msg.send
         except AttributeError:
             raise UnsupportedMessageTypeError(msg.__class__.__name__)
+        key = _message_key(msg)
+        if key in self._in_flight:
+            return
+        self._in_flight.add(key)
+        future = self._get_executor().submit(send)
+        future.add_done_callback(lambda f: self._in_flight.discard(key))
+        future.add_done_callback(_exception_handler)
+
+
+_tls = threading.local()
 
 
-MESSAGELOOP = MessageLoop()
+def get_loop():
+    """Return the calling thread's MessageLoop, creating it on first use.
+       Per-thread loops keep the in-flight bookkeeping free of cross-thread
+       contention without any locking."""
+    if not hasattr(_tls, "loop"):
+        _tls.loop = MessageLoop()
+    return _tls.loop
@@ -25,6 +25,10 @@ MESSAGE_CLASSES = {
 }
 MESSAGE_TYPES = {i.__name__.lower(): i for i in MESSAGE_CLASSES}
 
+# Supported message type names, exported for enumeration/display;
+# validation itself goes through the MESSAGE_TYPES dict lookup.
+MESSAGES = tuple(sorted(MESSAGE_TYPES))
+
 
 def send(msg_type, send_async=False, *args, **kwargs):
     """
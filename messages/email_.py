@@ -16,7 +16,7 @@ from email.mime.text import MIMEText
 from email.mime.application import MIMEApplication
 
 from ._config import check_config_file
-from ._eventloop import MESSAGELOOP
+from ._eventloop import get_loop
 from ._exceptions import MessageSendError
 from ._interface import Message
 from ._utils import credential_property
@@ -294,4 +294,4 @@ class Email(Message):
 
     def send_async(self):
         """Send message asynchronously."""
-        MESSAGELOOP.add_message(self)
+        get_loop().add_message(self)
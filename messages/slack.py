@@ -22,7 +22,7 @@ import reprlib
 import requests
 
 from ._config import check_config_file
-from ._eventloop import MESSAGELOOP
+from ._eventloop import get_loop
 from ._exceptions import MessageSendError
 from ._interface import Message
 from ._utils import credential_property
@@ -95,7 +95,7 @@ class Slack(Message):
 
     def send_async(self):
         """Send message asynchronously."""
-        MESSAGELOOP.add_message(self)
+        get_loop().add_message(self)
 
 
 class SlackWebhook(Slack):
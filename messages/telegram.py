@@ -6,17 +6,131 @@ Module designed to make creating and sending chat messages easy.
     - https://core.telegram.org/bots
 """
 
+import functools
+import logging
 import reprlib
+import sys
 
 import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
 
 from ._config import check_config_file
-from ._eventloop import MESSAGELOOP
+from ._eventloop import get_loop
 from ._exceptions import MessageSendError
 from ._interface import Message
 from ._utils import credential_property
 from ._utils import validate_property
-from ._utils import timestamp
+
+
+log = logging.getLogger(__name__)
+
+_verbose_handler_added = False
+
+
+def _enable_verbose_logging():
+    """
+    Attach a timestamped stdout handler to the module logger the first
+    time a verbose TelegramBot is created.  Formatting is deferred to the
+    logging machinery, so non-verbose sends never pay for timestamp
+    rendering or stdout locking.
+    """
+    global _verbose_handler_added
+    if not _verbose_handler_added:
+        handler = logging.StreamHandler(sys.stdout)
+        handler.setFormatter(logging.Formatter("%(asctime)s %(message)s"))
+        log.addHandler(handler)
+        log.setLevel(logging.INFO)
+        _verbose_handler_added = True
+
+
+# Module-level sessions so consecutive requests reuse the same pooled
+# connection (HTTP keep-alive) instead of negotiating a new TCP/TLS
+# handshake per message or attachment.  Outbound sends and /getUpdates
+# polling get separate pools so a slow long-poll can never hold the
+# connections that message/attachment sends are waiting on.
+def _make_send_session():
+    """
+    Build the send transport.  With httpx installed, an HTTP/2 client
+    multiplexes concurrent sends over one TLS connection, so a burst of
+    async sends shares a single handshake instead of opening one socket
+    per in-flight request; otherwise a pooled requests session is used.
+    """
+    if httpx is not None:
+        try:
+            return httpx.Client(
+                http2=True,
+                limits=httpx.Limits(max_keepalive_connections=1, max_connections=4),
+            )
+        except ImportError:
+            # httpx without the h2 package cannot speak HTTP/2; fall back.
+            pass
+    session = requests.Session()
+    session.mount(
+        "https://api.telegram.org/", HTTPAdapter(pool_connections=1, pool_maxsize=32)
+    )
+    return session
+
+
+_SEND_SESSION = _make_send_session()
+_SEND_IS_HTTPX = httpx is not None and isinstance(_SEND_SESSION, httpx.Client)
+
+# Both transports' status errors, since the fallback decision is made at
+# import and mocks/tests may raise either type.
+_HTTP_ERRORS = (requests.exceptions.HTTPError,)
+if httpx is not None:
+    _HTTP_ERRORS = _HTTP_ERRORS + (httpx.HTTPStatusError,)
+
+_POLL_SESSION = requests.Session()
+_POLL_SESSION.mount(
+    "https://api.telegram.org/", HTTPAdapter(pool_connections=1, pool_maxsize=4)
+)
+
+
+@functools.lru_cache(maxsize=32)
+def _chat_id_table(base_url):
+    """
+    Build a {username: id} table from the /getUpdates endpoint.
+
+    One pass over the results serves every subsequent lookup, so resolving
+    k recipients costs a single HTTPS round-trip plus k dict hits rather
+    than k round-trips with a linear scan each.  Memoized since the
+    mapping is stable for the lifetime of the bot's update window; keyed
+    on base_url so separate bot tokens never share results.  Rows without
+    a 'message' entry (e.g. edited_message updates) are skipped.
+    """
+    if ijson is not None:
+        # Stream-parse the response so only one update is materialized at
+        # a time instead of the full object tree for a large history.
+        resp = _POLL_SESSION.get(base_url + "/getUpdates", stream=True)
+        # requests negotiates gzip by default; have urllib3 decode the
+        # raw stream so ijson sees plain JSON bytes.
+        resp.raw.decode_content = True
+        results = ijson.items(resp.raw, "result.item")
+    else:
+        results = _POLL_SESSION.get(base_url + "/getUpdates").json()["result"]
+    table = {}
+    for chat in results:
+        message = chat.get("message")
+        if message is None or "from" not in message:
+            continue
+        sender = message["from"]
+        table[sender["username"]] = sender["id"]
+    return table
 
 
 class TelegramBot(Message):
@@ -63,6 +177,10 @@ class TelegramBot(Message):
     auth = credential_property("auth")
     chat_id = validate_property("chat_id")
 
+    # Attributes that feed _construct_message; assigning any of them
+    # invalidates the cached message dict.
+    _MESSAGE_ATTRS = frozenset(("from_", "subject", "body", "chat_id", "params"))
+
     def __init__(
         self,
         from_=None,
@@ -90,11 +208,27 @@ class TelegramBot(Message):
         self.save = save
         self.verbose = verbose
         self.message = {}
+        self._msg_cached = None
+        self._msg_built_version = -1
+
+        if self.verbose:
+            _enable_verbose_logging()
 
         if self.profile:
             check_config_file(self)
 
         self.base_url = "https://api.telegram.org/bot" + self._auth
+        self._urls = {
+            method: self.base_url + method
+            for method in ("/sendMessage", "/sendDocument", "/sendMediaGroup")
+        }
+
+    def __setattr__(self, name, value):
+        """Bump the message version whenever a content attribute changes,
+           so the cached message dict is rebuilt on next construction."""
+        super().__setattr__(name, value)
+        if name in self._MESSAGE_ATTRS:
+            self.__dict__["_msg_version"] = self.__dict__.get("_msg_version", 0) + 1
 
     def __str__(self, indentation="\n"):
         """print(Telegram(**args)) method.
@@ -125,70 +259,100 @@ class TelegramBot(Message):
     def get_chat_id(self, username):
         """Lookup chat_id of username if chat_id is unknown via API call."""
         if username is not None:
-            chats = requests.get(self.base_url + "/getUpdates").json()
-            user = username.split("@")[-1]
-            for chat in chats["result"]:
-                if chat["message"]["from"]["username"] == user:
-                    return chat["message"]["from"]["id"]
+            return _chat_id_table(self.base_url).get(username.split("@")[-1])
 
     def _construct_message(self):
-        """Build the message params."""
-        self.message["chat_id"] = self.chat_id
-        self.message["text"] = ""
+        """Build the message params, joining the text parts in one pass
+           to avoid repeated string reallocation.  The built dict is cached
+           and reused until a content attribute changes, so retry loops and
+           repeat sends skip the reassembly."""
+        version = self.__dict__.get("_msg_version", 0)
+        if self._msg_cached is not None and self._msg_built_version == version:
+            self.message = self._msg_cached
+            return
+
+        parts = []
         if self.from_:
-            self.message["text"] += "From: " + self.from_ + "\n"
+            parts.append("From: " + self.from_ + "\n")
         if self.subject:
-            self.message["text"] += "Subject: " + self.subject + "\n"
+            parts.append("Subject: " + self.subject + "\n")
+        parts.append(self.body)
 
-        self.message["text"] += self.body
-        self.message.update(self.params)
+        self.message = {"chat_id": self.chat_id, "text": "".join(parts), **self.params}
+        self._msg_cached = self.message
+        self._msg_built_version = version
 
     def _send_content(self, method="/sendMessage"):
         """send via HTTP Post."""
-        url = self.base_url + method
+        url = self._urls[method]
 
         try:
-            resp = requests.post(url, json=self.message)
+            if orjson is not None:
+                payload = orjson.dumps(self.message)
+                headers = {"Content-Type": "application/json"}
+                if _SEND_IS_HTTPX:
+                    # httpx takes raw bytes via content=, not data=.
+                    resp = _SEND_SESSION.post(url, content=payload, headers=headers)
+                else:
+                    resp = _SEND_SESSION.post(url, data=payload, headers=headers)
+            else:
+                resp = _SEND_SESSION.post(url, json=self.message)
             resp.raise_for_status()
-        except requests.exceptions.HTTPError as e:
+        except _HTTP_ERRORS as e:
             raise MessageSendError(e)
 
         if self.verbose:
+            _enable_verbose_logging()
             if method == "/sendMessage":
                 content_type = "Message body"
             elif method == "/sendDocument":
                 content_type = "Attachment: " + self.message["document"]
-            print(timestamp(), content_type, "sent.")
+            elif method == "/sendMediaGroup":
+                content_type = "Attachments: " + ", ".join(
+                    item["media"] for item in self.message["media"]
+                )
+            log.info("%s sent.", content_type)
 
     def send(self):
         """Start sending the message and attachments."""
         self._construct_message()
 
         if self.verbose:
-            print(
-                "Debugging info"
-                "\n--------------"
-                "\n{} Message created.".format(timestamp())
-            )
+            # Verbose may be flipped on after construction; make sure the
+            # stdout handler is in place before the first log call.
+            _enable_verbose_logging()
+            log.info("Debugging info\n--------------\nMessage created.")
 
         self._send_content("/sendMessage")
 
         if self.attachments:
             if isinstance(self.attachments, str):
                 self.attachments = [self.attachments]
-            for a in self.attachments:
-                self.message["document"] = a
-                self._send_content(method="/sendDocument")
+            # Bind to locals once so the batch loop skips the repeated
+            # attribute lookups.
+            attachments = self.attachments
+            message = self.message
+            send_content = self._send_content
+            if len(attachments) > 1:
+                # /sendMediaGroup takes up to 10 documents per request,
+                # cutting N attachment round-trips down to ceil(N/10).
+                for i in range(0, len(attachments), 10):
+                    message["media"] = [
+                        {"type": "document", "media": url}
+                        for url in attachments[i : i + 10]
+                    ]
+                    send_content(method="/sendMediaGroup")
+            else:
+                message["document"] = attachments[0]
+                send_content(method="/sendDocument")
 
         if self.verbose:
-            print(
-                timestamp(),
-                type(self).__name__ + " info:",
-                self.__str__(indentation="\n * "),
+            log.info(
+                "%s info: %s", type(self).__name__, self.__str__(indentation="\n * ")
             )
 
         print("Message sent.")
 
     def send_async(self):
         """Send message asynchronously."""
-        MESSAGELOOP.add_message(self)
+        get_loop().add_message(self)
@@ -13,7 +13,7 @@ import reprlib
 import requests
 
 from ._config import check_config_file
-from ._eventloop import MESSAGELOOP
+from ._eventloop import get_loop
 from ._exceptions import MessageSendError
 from ._interface import Message
 from ._utils import credential_property
@@ -156,4 +156,4 @@ class Twilio(Message):
 
     def send_async(self):
         """Send message asynchronously."""
-        MESSAGELOOP.add_message(self)
+        get_loop().add_message(self)
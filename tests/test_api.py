@@ -168,3 +168,26 @@ def test_err_exit(capsys):
         out, err = capsys.readouterr()
         assert 'error:' in out
         assert 'bad profile' in out
+
+
+##############################################################################
+# TESTS: MESSAGES
+##############################################################################
+
+def test_messages_constant():
+    """
+    GIVEN the supported message types
+    WHEN the MESSAGES constant is inspected
+    THEN assert it lists every supported type name in sorted order
+    """
+    assert messages.api.MESSAGES == tuple(sorted(messages.api.MESSAGE_TYPES))
+
+
+def test_messages_constant_lazy_export():
+    """
+    GIVEN the messages package namespace
+    WHEN MESSAGES is accessed as a package attribute
+    THEN assert the lazy re-export resolves to the api constant
+    """
+    import messages
+    assert messages.MESSAGES is messages.api.MESSAGES
@@ -11,7 +11,6 @@ import pytest
 import messages
 from messages.email_ import Email
 from messages.email_ import check_config_file
-from messages._eventloop import MESSAGELOOP
 from messages._exceptions import MessageSendError
 
 from conftest import skip_if_on_travisCI
@@ -481,10 +480,10 @@ def test_send_async(get_email, mocker):
     WHEN Email.send_async() is called
     THEN assert it is added to the event loop for async sending
     """
-    msg_loop_mock = mocker.patch.object(MESSAGELOOP, 'add_message')
+    msg_loop_mock = mocker.patch.object(messages.email_, 'get_loop')
     e = get_email
     e.send_async()
-    assert msg_loop_mock.call_count == 1
+    assert msg_loop_mock.return_value.add_message.call_count == 1
 
 
 def test_send_async_verbose_true(get_email, mocker):
@@ -493,8 +492,8 @@ def test_send_async_verbose_true(get_email, mocker):
     WHEN Email.send_async() is called
     THEN assert it is added to the event loop for async sending
     """
-    msg_loop_mock = mocker.patch.object(MESSAGELOOP, 'add_message')
+    msg_loop_mock = mocker.patch.object(messages.email_, 'get_loop')
     e = get_email
     e.verbose = True
     e.send_async()
-    assert msg_loop_mock.call_count == 1
+    assert msg_loop_mock.return_value.add_message.call_count == 1
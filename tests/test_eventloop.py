@@ -2,11 +2,10 @@
 
 import pytest
 
-import asyncio
 from unittest.mock import Mock
 
 import messages._eventloop
-from messages._eventloop import MessageLoop, _send_coroutine, _exception_handler
+from messages._eventloop import MessageLoop, _exception_handler
 from messages._exceptions import UnsupportedMessageTypeError
 
 
@@ -31,12 +30,6 @@ class MsgBad:
     def __init__(self): pass
 
 
-class FakeFuture:
-    """A Fake Future to test with the PoolExecutor."""
-    def add_done_callback(self, func):
-        pass
-
-
 class FakeClass:
     """Test Class that raises an Exception with send()."""
     def __init__(self): pass
@@ -55,6 +48,23 @@ def test_init(get_messageloop):
     """
     ml = get_messageloop
     assert ml is not None
+    assert ml._executor is None
+
+
+##############################################################################
+# TESTS: MessageLoop._get_executor
+##############################################################################
+
+def test_get_executor_lazyCreation(get_messageloop):
+    """
+    GIVEN a valid MessageLoop object
+    WHEN _get_executor() is called for the first time
+    THEN assert the worker pool is created and reused on later calls
+    """
+    ml = get_messageloop
+    executor = ml._get_executor()
+    assert executor is not None
+    assert ml._get_executor() is executor
 
 
 ##############################################################################
@@ -65,13 +75,92 @@ def test_add_message_msgGood(get_messageloop, mocker):
     """
     GIVEN a valid MessageLoop object
     WHEN a valid message is added with the add_message method
-    THEN assert it is added and _send_coroutine() is sent the message
+    THEN assert it is submitted to the worker pool
+    """
+    ml = get_messageloop
+    exec_mock = mocker.patch.object(MessageLoop, '_get_executor')
+    msg = MsgGood()
+    ml.add_message(msg)
+    assert exec_mock.return_value.submit.call_count == 1
+    assert exec_mock.return_value.submit.return_value.add_done_callback.call_count == 2
+
+
+def test_add_message_duplicateInFlight(get_messageloop, mocker):
+    """
+    GIVEN a valid MessageLoop object
+    WHEN the same message content is added twice before the first send
+        completes
+    THEN assert only the first is submitted to the worker pool
+    """
+    ml = get_messageloop
+    exec_mock = mocker.patch.object(MessageLoop, '_get_executor')
+    ml.add_message(MsgGood())
+    ml.add_message(MsgGood())
+    assert exec_mock.return_value.submit.call_count == 1
+
+
+def test_add_message_distinctDestinations(get_messageloop, mocker):
+    """
+    GIVEN a valid MessageLoop object
+    WHEN two messages share content but differ in credentials/destination
+    THEN assert both are submitted to the worker pool
+    """
+    ml = get_messageloop
+    exec_mock = mocker.patch.object(MessageLoop, '_get_executor')
+    msg1, msg2 = MsgGood(), MsgGood()
+    msg1._auth = 'https://hooks.example.com/one'
+    msg2._auth = 'https://hooks.example.com/two'
+    ml.add_message(msg1)
+    ml.add_message(msg2)
+    assert exec_mock.return_value.submit.call_count == 2
+
+
+def test_add_message_distinctChannels(get_messageloop, mocker):
+    """
+    GIVEN a valid MessageLoop object
+    WHEN two messages share content but differ only in channel
+    THEN assert both are submitted to the worker pool
+    """
+    ml = get_messageloop
+    exec_mock = mocker.patch.object(MessageLoop, '_get_executor')
+    msg1, msg2 = MsgGood(), MsgGood()
+    msg1._auth = msg2._auth = 'token'
+    msg1.channel = '#general'
+    msg2.channel = '#alerts'
+    ml.add_message(msg1)
+    ml.add_message(msg2)
+    assert exec_mock.return_value.submit.call_count == 2
+
+
+def test_add_message_distinctParams(get_messageloop, mocker):
+    """
+    GIVEN a valid MessageLoop object
+    WHEN two messages share content but differ only in params
+    THEN assert both are submitted to the worker pool
+    """
+    ml = get_messageloop
+    exec_mock = mocker.patch.object(MessageLoop, '_get_executor')
+    msg1, msg2 = MsgGood(), MsgGood()
+    msg1.params = {'parse_mode': 'HTML'}
+    msg2.params = {'parse_mode': 'Markdown'}
+    ml.add_message(msg1)
+    ml.add_message(msg2)
+    assert exec_mock.return_value.submit.call_count == 2
+
+
+def test_add_message_resendAfterCompletion(get_messageloop, mocker):
+    """
+    GIVEN a valid MessageLoop object
+    WHEN the same message content is added again after the first send
+        completed
+    THEN assert both are submitted to the worker pool
     """
-    coro_mock = mocker.patch.object(messages._eventloop, '_send_coroutine')
-    coro_mock.return_value.__next__.return_value.send.return_value = None
     ml = get_messageloop
+    exec_mock = mocker.patch.object(MessageLoop, '_get_executor')
+    ml.add_message(MsgGood())
+    ml._in_flight.clear()
     ml.add_message(MsgGood())
-    #assert coro_mock.send.call_count == 1
+    assert exec_mock.return_value.submit.call_count == 2
 
 
 def test_add_message_msgBad(get_messageloop):
@@ -86,32 +175,27 @@ def test_add_message_msgBad(get_messageloop):
 
 
 ##############################################################################
-# TESTS: _send_coroutine
+# TESTS: _exception_handler
 ##############################################################################
 
-def test_send_coro(mocker):
+def test_exception_handler_raises():
     """
-    GIVEN a future to start
-    WHEN _send_coroutine() is initiated
-    THEN assert the correct sequence occurs
+    GIVEN a completed future whose send() raised an exception
+    WHEN _exception_handler() is called as the done callback
+    THEN assert the exception is reraised
     """
-    pool_mock = mocker.patch.object(messages._eventloop, 'PoolExecutor')
-    pool_mock.submit.return_value = FakeFuture()
-
-    coro = _send_coroutine()
-    next(coro)
-
-    coro.send(MsgGood())
-    coro.close()
+    future = Mock()
+    future.exception.return_value = ValueError()
+    with pytest.raises(ValueError):
+        _exception_handler(future)
 
 
-def test_send_coro_raises():
+def test_exception_handler_noException():
     """
-    GIVEN a future to start
-    WHEN the future is executed and raises an exception
-    THEN assert the exception is raised
+    GIVEN a completed future whose send() succeeded
+    WHEN _exception_handler() is called as the done callback
+    THEN assert nothing is raised
     """
-    coro = _send_coroutine()
-    next(coro)
-    with pytest.raises(ValueError):
-        coro.send(FakeClass())
+    future = Mock()
+    future.exception.return_value = None
+    _exception_handler(future)
@@ -6,7 +6,6 @@ import requests
 import messages.slack
 from messages.slack import SlackWebhook
 from messages.slack import SlackPost
-from messages._eventloop import MESSAGELOOP
 from messages._exceptions import MessageSendError
 
 
@@ -423,10 +422,10 @@ def test_slackWH_send_async(get_slackWH, mocker):
     WHEN send_async() is called
     THEN assert the proper send sequence occurs
     """
-    msgloop_mock = mocker.patch.object(MESSAGELOOP, 'add_message')
+    msgloop_mock = mocker.patch.object(messages.slack, 'get_loop')
     s = get_slackWH
     s.send_async()
-    assert msgloop_mock.call_count == 1
+    assert msgloop_mock.return_value.add_message.call_count == 1
 
 
 def test_slackP_send_async(get_slackP, mocker):
@@ -435,7 +434,7 @@ def test_slackP_send_async(get_slackP, mocker):
     WHEN send_async() is called
     THEN assert the proper send sequence occurs
     """
-    msgloop_mock = mocker.patch.object(MESSAGELOOP, 'add_message')
+    msgloop_mock = mocker.patch.object(messages.slack, 'get_loop')
     s = get_slackP
     s.send_async()
-    assert msgloop_mock.call_count == 1
+    assert msgloop_mock.return_value.add_message.call_count == 1
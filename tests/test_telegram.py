@@ -1,11 +1,12 @@
 """messages.slack tests."""
 
+import logging
+
 import pytest
 import requests
 
 import messages.telegram
 from messages.telegram import TelegramBot
-from messages._eventloop import MESSAGELOOP
 from messages._exceptions import MessageSendError
 
 
@@ -69,13 +70,15 @@ def test_tgram_str(get_tgram, capsys):
 # TESTS: TelegramBot.get_chat_id
 ##############################################################################
 
-def test_tgram_getChatID(get_tgram, mocker):
+def test_tgram_getChatID(get_tgram, mocker, monkeypatch):
     """
     GIVEN a TelegramBot instance with unknown chat_id of recipient
     WHEN get_chat_id() is called
     THEN assert proper data is returned
     """
-    req_mock = mocker.patch.object(requests, 'get')
+    messages.telegram._chat_id_table.cache_clear()
+    monkeypatch.setattr(messages.telegram, 'ijson', None)
+    req_mock = mocker.patch.object(messages.telegram._POLL_SESSION, 'get')
     req_mock.return_value.json.return_value = {'result': [{'message':{
         'from':{'username': 'YOU', 'id': '123456'}}}]}
     t = get_tgram
@@ -83,6 +86,47 @@ def test_tgram_getChatID(get_tgram, mocker):
     assert id == '123456'
 
 
+def test_tgram_getChatID_memoized(get_tgram, mocker, monkeypatch):
+    """
+    GIVEN a TelegramBot instance with unknown chat_id of recipient
+    WHEN get_chat_id() is called repeatedly for the same username
+    THEN assert only one API call is made
+    """
+    messages.telegram._chat_id_table.cache_clear()
+    monkeypatch.setattr(messages.telegram, 'ijson', None)
+    req_mock = mocker.patch.object(messages.telegram._POLL_SESSION, 'get')
+    req_mock.return_value.json.return_value = {'result': [{'message':{
+        'from':{'username': 'MEMO', 'id': '654321'}}}]}
+    t = get_tgram
+    assert t.get_chat_id('@MEMO') == '654321'
+    assert t.get_chat_id('@MEMO') == '654321'
+    assert req_mock.call_count == 1
+
+
+def test_tgram_getChatID_ijson(get_tgram, mocker, monkeypatch):
+    """
+    GIVEN a TelegramBot instance and the optional ijson parser installed
+    WHEN get_chat_id() is called
+    THEN assert the decoded response stream is parsed incrementally
+    """
+    messages.telegram._chat_id_table.cache_clear()
+
+    class FakeIjson:
+        @staticmethod
+        def items(raw, path):
+            assert raw.decode_content is True
+            assert path == 'result.item'
+            return iter([{'message': {
+                'from': {'username': 'STREAM', 'id': '789'}}}])
+
+    monkeypatch.setattr(messages.telegram, 'ijson', FakeIjson)
+    req_mock = mocker.patch.object(messages.telegram._POLL_SESSION, 'get')
+    t = get_tgram
+    assert t.get_chat_id('@STREAM') == '789'
+    req_mock.assert_called_once_with(t.base_url + '/getUpdates', stream=True)
+    assert req_mock.return_value.json.call_count == 0
+
+
 ##############################################################################
 # TESTS: TelegramBot._construct_message
 ##############################################################################
@@ -112,6 +156,23 @@ def test_tgram_construct_message_withFromSub(get_tgram):
     assert t.message['text'] == expected
 
 
+def test_tgram_construct_message_cached(get_tgram):
+    """
+    GIVEN a valid TelegramBot object
+    WHEN construct_message() is called repeatedly
+    THEN assert the cached dict is reused until a content attribute changes
+    """
+    t = get_tgram
+    t._construct_message()
+    first = t.message
+    t._construct_message()
+    assert t.message is first
+    t.body = 'new message'
+    t._construct_message()
+    assert t.message is not first
+    assert t.message['text'] == 'new message'
+
+
 ##############################################################################
 # TESTS: TelegramBot._send_content
 ##############################################################################
@@ -122,7 +183,7 @@ def test_tgram_send_content_verbose_false(get_tgram, capsys, mocker):
     WHEN send_content() is called with verbose=False
     THEN assert the proper send sequence occurs
     """
-    req_mock = mocker.patch.object(requests, 'post')
+    req_mock = mocker.patch.object(messages.telegram._SEND_SESSION, 'post')
     t = get_tgram
     t._send_content()
     out, err = capsys.readouterr()
@@ -131,40 +192,78 @@ def test_tgram_send_content_verbose_false(get_tgram, capsys, mocker):
     assert err == ''
 
 
-def test_tgram_send_content_msgBody_verbose_true(get_tgram, capsys, mocker):
+def test_tgram_send_content_msgBody_verbose_true(get_tgram, caplog, mocker):
     """
     GIVEN a valid TelegramBot object
     WHEN send_content() is called with verbose=True
     THEN assert the proper send sequence occurs
     """
-    req_mock = mocker.patch.object(requests, 'post')
+    caplog.set_level(logging.INFO, logger='messages.telegram')
+    req_mock = mocker.patch.object(messages.telegram._SEND_SESSION, 'post')
     t = get_tgram
     t.verbose = True
     t._send_content()
-    out, err = capsys.readouterr()
     assert req_mock.call_count == 1
-    assert 'Message body sent' in out
-    assert 'Attachment: https://url1.com' not in out
-    assert 'Attachment: https://url2.com' not in out
-    assert err == ''
+    assert 'Message body sent' in caplog.text
+    assert 'Attachment: https://url1.com' not in caplog.text
+    assert 'Attachment: https://url2.com' not in caplog.text
 
 
-def test_tgram_send_content_attachments_verbose_true_list(get_tgram, capsys, mocker):
+def test_tgram_send_content_attachments_verbose_true_list(get_tgram, caplog, mocker):
     """
     GIVEN a valid TelegramBot object
     WHEN send_content() is called with verbose=True
     THEN assert the proper send sequence occurs
     """
-    req_mock = mocker.patch.object(requests, 'post')
+    caplog.set_level(logging.INFO, logger='messages.telegram')
+    req_mock = mocker.patch.object(messages.telegram._SEND_SESSION, 'post')
     t = get_tgram
     t.verbose = True
     t.message['document'] = 'https://url1.com'
     t._send_content(method='/sendDocument')
-    out, err = capsys.readouterr()
     assert req_mock.call_count == 1
-    assert 'Message body sent' not in out
-    assert 'Attachment: https://url1.com' in out
-    assert err == ''
+    assert 'Message body sent' not in caplog.text
+    assert 'Attachment: https://url1.com' in caplog.text
+
+
+def test_tgram_send_content_verbose_postConstruction(get_tgram, mocker):
+    """
+    GIVEN a TelegramBot created without verbose
+    WHEN verbose is enabled afterward and send_content() is called
+    THEN assert verbose logging is still configured
+    """
+    enable_mock = mocker.patch.object(messages.telegram, '_enable_verbose_logging')
+    mocker.patch.object(messages.telegram._SEND_SESSION, 'post')
+    t = get_tgram
+    t.verbose = True
+    t._send_content()
+    assert enable_mock.call_count == 1
+
+
+def test_make_send_session_httpx(mocker, monkeypatch):
+    """
+    GIVEN the optional httpx dependency installed
+    WHEN the send session is built
+    THEN assert an HTTP/2 client is returned
+    """
+    fake_httpx = mocker.Mock()
+    monkeypatch.setattr(messages.telegram, 'httpx', fake_httpx)
+    session = messages.telegram._make_send_session()
+    assert session is fake_httpx.Client.return_value
+    assert fake_httpx.Client.call_args[1]['http2'] is True
+
+
+def test_make_send_session_httpx_without_h2(mocker, monkeypatch):
+    """
+    GIVEN httpx installed without its h2 dependency
+    WHEN the send session is built
+    THEN assert it falls back to a pooled requests session
+    """
+    fake_httpx = mocker.Mock()
+    fake_httpx.Client.side_effect = ImportError
+    monkeypatch.setattr(messages.telegram, 'httpx', fake_httpx)
+    session = messages.telegram._make_send_session()
+    assert isinstance(session, requests.Session)
 
 
 def test_tgram_send_content_raisesMessSendErr(get_tgram, mocker):
@@ -173,7 +272,7 @@ def test_tgram_send_content_raisesMessSendErr(get_tgram, mocker):
     WHEN send_content() is called but an http error occurs
     THEN assert MessageSendError is raised
     """
-    req_mock = mocker.patch.object(requests, 'post')
+    req_mock = mocker.patch.object(messages.telegram._SEND_SESSION, 'post')
     req_mock.return_value.raise_for_status.side_effect = requests.exceptions.HTTPError()
     t = get_tgram
     with pytest.raises(MessageSendError):
@@ -184,29 +283,31 @@ def test_tgram_send_content_raisesMessSendErr(get_tgram, mocker):
 # TESTS: TelegramBot.send
 ##############################################################################
 
-def test_send_verbose_false(get_tgram, mocker, capsys):
+def test_send_verbose_false(get_tgram, mocker, capsys, caplog):
     """
     GIVEN a TelegramBot instance
     WHEN send() is called with verbose=False
     THEN assert correct sequence is called and correct output printed
     """
+    caplog.set_level(logging.INFO, logger='messages.telegram')
     con_mock = mocker.patch.object(TelegramBot, '_construct_message')
     send_cont_mock = mocker.patch.object(TelegramBot, '_send_content')
     t = get_tgram
     t.send()
     out, err = capsys.readouterr()
     assert con_mock.call_count == 1
-    assert send_cont_mock.call_count == 3
+    assert send_cont_mock.call_count == 2
     assert 'Message sent.' in out
-    assert 'Debugging info' not in out
+    assert 'Debugging info' not in caplog.text
 
 
-def test_send_verbose_true(get_tgram, mocker, capsys):
+def test_send_verbose_true(get_tgram, mocker, capsys, caplog):
     """
     GIVEN a TelegramBot instance
     WHEN send() is called with verbose=True
     THEN assert correct sequence is called and correct output printed
     """
+    caplog.set_level(logging.INFO, logger='messages.telegram')
     con_mock = mocker.patch.object(TelegramBot, '_construct_message')
     send_cont_mock = mocker.patch.object(TelegramBot, '_send_content')
     t = get_tgram
@@ -214,18 +315,19 @@ def test_send_verbose_true(get_tgram, mocker, capsys):
     t.send()
     out, err = capsys.readouterr()
     assert con_mock.call_count == 1
-    assert send_cont_mock.call_count == 3
+    assert send_cont_mock.call_count == 2
     assert 'Message sent.' in out
-    assert 'Debugging info' in out
+    assert 'Debugging info' in caplog.text
 
 
-def test_send_attachmentStr(get_tgram, mocker, capsys):
+def test_send_attachmentStr(get_tgram, mocker, capsys, caplog):
     """
     GIVEN a TelegramBot instance
     WHEN send() is called with verbose=True and an attachment as a string
         instead of list of strings
     THEN assert correct sequence is called and correct output printed
     """
+    caplog.set_level(logging.INFO, logger='messages.telegram')
     con_mock = mocker.patch.object(TelegramBot, '_construct_message')
     send_cont_mock = mocker.patch.object(TelegramBot, '_send_content')
     t = get_tgram
@@ -236,7 +338,24 @@ def test_send_attachmentStr(get_tgram, mocker, capsys):
     assert con_mock.call_count == 1
     assert send_cont_mock.call_count == 2
     assert 'Message sent.' in out
-    assert 'Debugging info' in out
+    assert 'Debugging info' in caplog.text
+
+
+def test_send_mediaGroup(get_tgram, mocker):
+    """
+    GIVEN a TelegramBot instance with multiple attachments
+    WHEN send() is called
+    THEN assert attachments are batched into a single /sendMediaGroup call
+    """
+    con_mock = mocker.patch.object(TelegramBot, '_construct_message')
+    send_cont_mock = mocker.patch.object(TelegramBot, '_send_content')
+    t = get_tgram
+    t.send()
+    assert send_cont_mock.call_count == 2
+    send_cont_mock.assert_called_with(method='/sendMediaGroup')
+    assert t.message['media'] == [
+        {'type': 'document', 'media': 'https://url1.com'},
+        {'type': 'document', 'media': 'https://url2.com'}]
 
 
 ##############################################################################
@@ -249,7 +368,7 @@ def test_tgram_send_async(get_tgram, mocker):
     WHEN send_async() is called
     THEN assert the proper send sequence occurs
     """
-    msgloop_mock = mocker.patch.object(MESSAGELOOP, 'add_message')
+    msgloop_mock = mocker.patch.object(messages.telegram, 'get_loop')
     t = get_tgram
     t.send_async()
-    assert msgloop_mock.call_count == 1
+    assert msgloop_mock.return_value.add_message.call_count == 1
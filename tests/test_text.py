@@ -6,7 +6,6 @@ import requests
 import messages.text
 from messages.text import Twilio
 from messages.text import check_config_file
-from messages._eventloop import MESSAGELOOP
 from messages._exceptions import MessageSendError
 
 
@@ -149,7 +148,7 @@ def test_send_async(cfg_mock, get_twilio, mocker):
     WHEN Twilio.send_async() is called
     THEN assert it is added to the event loop for async sending
     """
-    msg_loop_mock = mocker.patch.object(MESSAGELOOP, 'add_message')
+    msg_loop_mock = mocker.patch.object(messages.text, 'get_loop')
     t = get_twilio
     t.send_async()
-    assert msg_loop_mock.call_count == 1
+    assert msg_loop_mock.return_value.add_message.call_count == 1
@@ -6,7 +6,6 @@ import requests
 import messages.whatsapp
 from messages.whatsapp import WhatsApp
 from messages.whatsapp import check_config_file
-from messages._eventloop import MESSAGELOOP
 
 
 ##############################################################################